@@ -13,16 +13,62 @@ Date Last Updated:
 '''
 
 # Import Libraries
-import argparse
 import os
-from fpdf import FPDF
-from typing import Union, Tuple, Dict, Any
+import threading
+from dataclasses import replace
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Union, Tuple, Mapping
 
 # Import Files
-from ocr import extract_itt
-from translation import translate
-from tts import create_wav
-from parser import parse_text
+# ocr (OpenCV, tesseract) and translation (torch, transformers) are heavy, so they are imported
+# inside the stages that use them; --help and runs that stop early never load them
+from parser import parse_text, Plaque
+import ocr_cache
+import logger
+from logger import log
+
+# Working directory, resolved once at import
+_BASE_PATH = Path.cwd()
+
+# PDF fonts (fpdf2), resolved next to this file so output works from any working directory
+_FONT_DIR = Path(__file__).resolve().parent
+_PDF_FONTS = {
+    '': str(_FONT_DIR / "D-DIN.ttf"),
+    'B': str(_FONT_DIR / "D-DIN-Bold.ttf"),
+    'I': str(_FONT_DIR / "D-DIN-Italic.ttf"),
+}
+# Optional Unicode font used for glyphs D-DIN does not have
+_PDF_FALLBACK_FONT = os.environ.get("PDF_FALLBACK_FONT")
+
+# Image file types picked up in batch mode
+_IMAGE_EXTS = {'.png', '.jpg', '.jpeg', '.tif', '.tiff', '.bmp'}
+
+# Load the translation model in the background while a single image is OCR'd (batch mode always
+# does). Off by default since it loads the model even when the translation cache would be hit
+_PRELOAD_TRANSLATION = os.environ.get("TRANSLATION_PRELOAD") == "1"
+
+# Supported languages as (name, translation code (ISO 2-letter), OCR code (ISO 3-letter)) rows
+_LANG_ROWS: Tuple[Tuple[str, str, str], ...] = (
+    ('english', 'en', 'eng'),
+    ('french', 'fr', 'fra'),
+    ('german', 'de', 'deu'),
+    ('spanish', 'es', 'spa'),
+    ('italian', 'it', 'ita'),
+    # Add more as needed...
+    ('chinese', 'zh', 'chi_sim'),   # Chinese (simplified)
+    ('japanese', 'ja', 'jpn'),
+    ('russian', 'ru', 'rus'),
+)
+
+# Flat lookup built once at import: every accepted alias (name, 2-letter, 3-letter) -> (trans, ocr).
+# Read-only view so the table cannot be modified after import
+_ALIAS_TO_CODES: Mapping[str, Tuple[str, str]] = MappingProxyType({
+    alias: (trans, ocr)
+    for name, trans, ocr in _LANG_ROWS
+    for alias in (name, trans, ocr)
+})
 
 '''
 lang_converter()
@@ -37,65 +83,25 @@ Return:
     str - OCR language code (3-letter) if mode is 'ocr'
     Tuple[str, str] - Tuple of (source, target) translation codes (2-letter) if mode is 'trans'
 '''
+@lru_cache(maxsize=128)
 def lang_converter(mode: str, source: str, target: str = None) -> Union[str, Tuple[str, str]]:
-    # Mapping from common names/short codes to ISO 2-letter (for trans) and 3-letter (for ocr)
-    lang_map = {
-        # English
-        'english': {'trans': 'en', 'ocr': 'eng'},
-        'en': {'trans': 'en', 'ocr': 'eng'},
-        
-        # French
-        'french': {'trans': 'fr', 'ocr': 'fra'},
-        'fr': {'trans': 'fr', 'ocr': 'fra'},
-        
-        # German
-        'german': {'trans': 'de', 'ocr': 'deu'},
-        'de': {'trans': 'de', 'ocr': 'deu'},
-        
-        # Spanish
-        'spanish': {'trans': 'es', 'ocr': 'spa'},
-        'es': {'trans': 'es', 'ocr': 'spa'},
-        
-        # Italian
-        'italian': {'trans': 'it', 'ocr': 'ita'},
-        'it': {'trans': 'it', 'ocr': 'ita'},
-        
-        # Add more as needed...
-        # Chinese (simplified)
-        'chinese': {'trans': 'zh', 'ocr': 'chi_sim'},
-        'zh': {'trans': 'zh', 'ocr': 'chi_sim'},
-        
-        # Japanese
-        'japanese': {'trans': 'ja', 'ocr': 'jpn'},
-        'ja': {'trans': 'ja', 'ocr': 'jpn'},
-        
-        # Russian
-        'russian': {'trans': 'ru', 'ocr': 'rus'},
-        'ru': {'trans': 'ru', 'ocr': 'rus'},
-    }
-    
-    def normalize_lang(user_lang: str) -> Dict[str, str]:
-        low_lang = user_lang.lower().strip()
-        if low_lang in lang_map:
-            return lang_map[low_lang]
-        # Fallback: assume it's already a code
-        for key, val in lang_map.items():
-            if low_lang == val['trans'] or low_lang == val['ocr']:
-                return val
-        raise ValueError(f"Unsupported language: {user_lang}")
-    
+    src_codes = _ALIAS_TO_CODES.get(source.lower().strip())
+    if src_codes is None:
+        raise ValueError(f"Unsupported language: {source}")
+
     if mode == "ocr":
         if target is not None:
             raise ValueError("Target lang not needed for OCR mode")
-        return normalize_lang(source)['ocr']
-    
+        return src_codes[1]
+
     elif mode == "trans":
         if target is None:
             raise ValueError("Target lang required for trans mode")
-        src_codes = normalize_lang(source)
-        tgt_codes = normalize_lang(target)
-        return (src_codes['trans'], tgt_codes['trans'])
-    
+        tgt_codes = _ALIAS_TO_CODES.get(target.lower().strip())
+        if tgt_codes is None:
+            raise ValueError(f"Unsupported language: {target}")
+        return (src_codes[0], tgt_codes[0])
+
     else:
         raise ValueError(f"Invalid mode: {mode}. Use 'ocr' or 'trans'.")
 
@@ -103,29 +109,40 @@ def lang_converter(mode: str, source: str, target: str = None) -> Union[str, Tup
 text_extract()
 Description:
     Extracts text from an image using OCR (Optical Character Recognition).
-    Optionally returns confidence level of the extraction.
+    Optionally returns confidence level of the extraction. Results are cached on disk by image
+    content, so an image that has been processed before skips OCR entirely (except in debug mode).
 Args:
-    source_path (str) - Path to the source image file
+    source_path (Union[str, os.PathLike]) - Path to the source image file
     source_lang (str) - Language code for OCR (default: "eng")
-    debug (bool) - If True, prints extracted text and confidence to console
+    debug (bool) - If True, saves the preprocessed debug image (text and confidence are logged
+                   in debug mode)
     ret_conf (bool) - If True, calculates and returns average confidence level
+    use_cache (bool) - If False, always re-runs OCR (default: True)
 Return:
     Tuple[str, float] - Extracted text and average confidence level (or 0.0 if not requested)
 '''
-def text_extract(source_path: str,
+def text_extract(source_path: Union[str, os.PathLike],
                  source_lang: str = "eng",
                  debug: bool = True,
-                 ret_conf: bool = False) -> Tuple[str, float]:
-    extracted_text, avg_conf = extract_itt(source_path, source_lang, debug, ret_conf)
-
-    if ret_conf == True and debug == True:
-        print("----- Extracted Text -----")
-        print(extracted_text)
-        print("----- Average Confidence Level -----")
-        print(f"{avg_conf:.2f}%")
-    elif debug == True:
-        print("----- Extracted Text -----")
-        print(extracted_text)
+                 ret_conf: bool = False,
+                 use_cache: bool = True) -> Tuple[str, float]:
+    cache_key = ocr_cache.make_key(source_path, source_lang, ret_conf) if use_cache else None
+    # Debug mode always re-runs OCR so the preprocessed image is saved (the result is still cached)
+    cached = ocr_cache.get(cache_key) if use_cache and not debug else None
+    if cached is not None:
+        log("\t* Found OCR result in cache.")
+        extracted_text, avg_conf = cached
+    else:
+        from ocr import extract_itt
+        extracted_text, avg_conf = extract_itt(source_path, source_lang, debug, ret_conf)
+        if use_cache:
+            ocr_cache.put(cache_key, extracted_text, avg_conf)
+
+    log("----- Extracted Text -----")
+    log(extracted_text)
+    if ret_conf:
+        log("----- Average Confidence Level -----")
+        log("%.2f%%", avg_conf)
 
     return extracted_text, avg_conf
 
@@ -133,83 +150,73 @@ def text_extract(source_path: str,
 clean_text()
 Description:
     Parses raw OCR-extracted text into structured fields for museum plaque information.
+    Results are memoized, so re-parsing the same text returns immediately. Plaque is immutable,
+    so the cached instance can be shared safely.
 Args:
     raw_text (str) - Raw text extracted from OCR
     debug (bool) - If True, prints parsing information
 Return:
-    Dict[str, Any] - Dictionary containing parsed fields (author, title, year, etc.)
+    Plaque - Parsed plaque fields (author, title, year, etc.)
 '''
-def clean_text(raw_text: str, debug: bool) -> Dict[str, Any]:
-    information = parse_text(raw_text, debug)
-    return information
+@lru_cache(maxsize=512)
+def clean_text(raw_text: str, debug: bool) -> Plaque:
+    return parse_text(raw_text, debug)
 
 '''
 translate_text()
 Description:
-    Translates all fields of the museum plaque from source language to target language.
+    Translates all translatable fields of the museum plaque (see Plaque.TRANSLATED_FIELDS) from
+    source language to target language. All non-empty fields are sent to the translator as a
+    single batch; empty fields are left untouched. Only the description is translated sentence by
+    sentence, the short fields are full of initials and abbreviations ("Lillie P. Bliss Bequest").
 Args:
-    raw_life_info (str) - Artist's life information (birth-death dates)
-    raw_title (str) - Title of the artwork
-    raw_medium (str) - Medium/materials used
-    raw_source (str) - Source/credit line
-    raw_desc (str) - Description of the artwork
+    plaque (Plaque) - Parsed plaque in the source language
     source_lang (str) - Source language code
     target_lang (str) - Target language code
 Return:
-    Tuple[str, str, str, str, str] - Tuple of all translated fields in order
+    Plaque - Copy of the plaque with the translated fields replaced
 '''
-def translate_text(raw_life_info: str,
-                   raw_title: str,
-                   raw_medium: str,
-                   raw_source: str,
-                   raw_desc: str,
+def translate_text(plaque: Plaque,
                    source_lang: str,
-                   target_lang: str) -> Tuple[str, str, str, str, str]:
-
-    print("\t* Translating life info.")
-    trans_life_info = translate(raw_life_info, source_lang, target_lang)
-    print("\t* Translating title.")
-    trans_title = translate(raw_title, source_lang, target_lang)
-    print("\t* Translating medium.")
-    trans_medium = translate(raw_medium, source_lang, target_lang)
-    print("\t* Translating source.")
-    trans_source = translate(raw_source, source_lang, target_lang)
-    print("\t* Translating description.")
-    trans_desc = translate(raw_desc, source_lang, target_lang)
-    return trans_life_info, trans_title, trans_medium, trans_source, trans_desc
+                   target_lang: str) -> Plaque:
+
+    # Empty fields (e.g. no life info on the plaque) are kept as-is and never sent to the translator
+    fields = [field for field in Plaque.TRANSLATED_FIELDS if getattr(plaque, field).strip()]
+    if not fields:
+        log("\t* No text to translate.")
+        return plaque
+
+    # All remaining fields ride a single batched translation call
+    from translation import translate
+    log("\t* Translating %s.", ", ".join(fields))
+    translations = translate(
+        [getattr(plaque, field) for field in fields],
+        source_lang,
+        target_lang,
+        split_sentences=[field == 'description' for field in fields]
+    )
+    return replace(plaque, **dict(zip(fields, translations)))
 
 '''
 cli_output()
 Description:
     Prints the translated plaque information to the command line interface.
 Args:
-    author (str) - Artist's name
-    trans_life_info (str) - Translated life information
-    trans_title (str) - Translated artwork title
-    year (str) - Year the artwork was created
-    trans_medium (str) - Translated medium information
-    trans_source (str) - Translated source/credit line
-    trans_desc (str) - Translated description
+    plaque (Plaque) - Translated plaque
 Return:
     int - Returns -1 to indicate completion
 '''
-def cli_output(author: str,
-               trans_life_info: str,
-               trans_title: str,
-               year: str,
-               trans_medium: str,
-               trans_source: str,
-               trans_desc: str) -> int:
+def cli_output(plaque: Plaque) -> int:
 
     print("\n\n\n\n\n")
     print("---------- Translation ----------")
-    print(f"Author: {author}")
-    print(f"Life Information: {trans_life_info}")
-    print(f"Piece Title: {trans_title}")
-    print(f"Year: {year}")
-    print(f"Piece Medium: {trans_medium}")
-    print(f"Piece Source: {trans_source}")
-    print(f"Piece Description: {trans_desc}")
+    print(f"Author: {plaque.author}")
+    print(f"Life Information: {plaque.life_info}")
+    print(f"Piece Title: {plaque.title}")
+    print(f"Year: {plaque.year}")
+    print(f"Piece Medium: {plaque.medium}")
+    print(f"Piece Source: {plaque.source}")
+    print(f"Piece Description: {plaque.description}")
 
     return -1
 
@@ -218,66 +225,52 @@ pdf_output()
 Description:
     Creates a PDF file containing the translated plaque information with proper formatting.
 Args:
-    author (str) - Artist's name
-    trans_life_info (str) - Translated life information
-    trans_title (str) - Translated artwork title
-    year (str) - Year the artwork was created
-    trans_medium (str) - Translated medium information
-    trans_source (str) - Translated source/credit line
-    trans_desc (str) - Translated description
-    output_path (str) - Directory path where PDF will be saved
+    plaque (Plaque) - Translated plaque
+    output_path (Union[str, os.PathLike]) - Directory path where PDF will be saved
+    pdf_name (str) - File name of the PDF output (default: "Translated_Desc.pdf")
 Return:
     int - Returns -1 to indicate completion
 '''
-def pdf_output(author: str,
-               trans_life_info: str,
-               trans_title: str,
-               year: str,
-               trans_medium: str,
-               trans_source: str,
-               trans_desc: str,
-               output_path: str) -> int:
-    # Creating PDF
-    print("\t* Creating PDF file.")
-    pdf_out = FPDF()
+def pdf_output(plaque: Plaque,
+               output_path: Union[str, os.PathLike],
+               pdf_name: str = "Translated_Desc.pdf") -> int:
+    # Creating PDF (fpdf is only imported when PDF output is requested). Each document loads its
+    # own fonts: fpdf2 subsets a font in place when writing, so font objects cannot be shared
+    from fpdf import FPDF
+    log("\t* Creating PDF file.")
+    pdf_out = FPDF(unit="mm", format="A4")
     pdf_out.add_page()
-    pdf_out.add_font(family="D-DIN", style='', fname="D-DIN.ttf")
-    pdf_out.add_font(family="D-DIN", style='B', fname="D-DIN-Bold.ttf")
-    pdf_out.add_font(family="D-DIN", style='I', fname="D-DIN-Italic.ttf")
+    for style, fname in _PDF_FONTS.items():
+        pdf_out.add_font(family="D-DIN", style=style, fname=fname)
+    if _PDF_FALLBACK_FONT:
+        # D-DIN only covers Latin script, fall back for e.g. Chinese, Japanese, Russian output
+        pdf_out.add_font(family="Fallback", style='', fname=_PDF_FALLBACK_FONT)
+        pdf_out.set_fallback_fonts(["Fallback"], exact_match=False)
     pdf_out.set_margins(left=1.0, right=1.0, top=1.0)
 
-    print("\t* Writing PDF output.")
-    # Create Author Cell
-    pdf_out.set_font(family="D-DIN", style="B", size=20)
-    pdf_out.cell(200, 10, text=author, new_x='LEFT', new_y='NEXT')
-    
-    # Create Life Info Cell
-    pdf_out.set_font(family="D-DIN", style="", size=15)
-    pdf_out.cell(200, 10, trans_life_info, new_x='LEFT', new_y='NEXT')
-
-    # Create Title Cell
-    pdf_out.set_font(family="D-DIN", style="B", size=20)
-    pdf_out.cell(200, 10, text=trans_title, new_x='LEFT', new_y='NEXT')
-
-    # Create Year Cell
-    pdf_out.set_font(family="D-DIN", style="I", size=15)
-    pdf_out.cell(200, 10, text=year, new_x='LEFT', new_y='NEXT')
-
-    # Create Medium Cell
-    pdf_out.set_font(family="D-DIN", style="I", size=12)
-    pdf_out.cell(200, 10, text=trans_medium, new_x='LEFT', new_y='NEXT')
-
-    # Create Source Cell
-    pdf_out.set_font(family="D-DIN", style="I", size=12)
-    pdf_out.cell(200, 10, text=trans_source, new_x='LEFT', new_y='NEXT')
-
-    # Create Description Cell
-    pdf_out.set_font(family="D-DIN", style="", size=15)
-    pdf_out.multi_cell(200, 10, text=trans_desc, new_x='LEFT', new_y='NEXT')
+    log("\t* Writing PDF output.")
+    # (style, size, text) for each cell, in page order
+    rows = [
+        ("B", 20, plaque.author),       # Author
+        ("", 15, plaque.life_info),     # Life info
+        ("B", 20, plaque.title),        # Title
+        ("I", 15, plaque.year),         # Year
+        ("I", 12, plaque.medium),       # Medium
+        ("I", 12, plaque.source),       # Source
+        ("", 15, plaque.description),   # Description
+    ]
+
+    # Only switch fonts when the style changes, multi_cell wraps long fields to the page width
+    current_font = None
+    for style, size, text in rows:
+        if (style, size) != current_font:
+            pdf_out.set_font(family="D-DIN", style=style, size=size)
+            current_font = (style, size)
+        pdf_out.multi_cell(0, 10, text=text, new_x='LEFT', new_y='NEXT')
 
     # Save PDF output
-    print("\t* Saving translated description PDF to /Output_Files/Translated_Desc.pdf for review.")
-    pdf_out.output(output_path + "/Translated_Desc.pdf")
+    log("\t* Saving translated description PDF to /Output_Files/%s for review.", pdf_name)
+    pdf_out.output(os.path.join(output_path, pdf_name))
 
     return -1
 
@@ -291,9 +284,164 @@ Return:
     int - Returns -1 to indicate completion
 '''
 def audio_output() -> int:
+    from tts import create_wav
     create_wav()
     return -1
 
+'''
+resolve_path()
+Description:
+    Resolves a user-supplied path. Existing absolute paths are used as-is, otherwise the path is
+    taken relative to the working directory (e.g. "/Input_Files/plaque.jpg" or "Input_Files/plaque.jpg").
+Args:
+    path (str) - Path passed on the command line
+Return:
+    Path - Resolved path
+'''
+def resolve_path(path: str) -> Path:
+    user_path = Path(path)
+    if user_path.is_absolute() and user_path.exists():
+        return user_path
+    return _BASE_PATH / path.lstrip("/")
+
+'''
+process_text()
+Description:
+    Runs the post-OCR stages of the pipeline for a single plaque: parsing, translation, and output.
+Args:
+    extracted_text (str) - Raw text extracted from the plaque image
+    trans_source (str) - Source language translation code (2-letter)
+    trans_target (str) - Target language translation code (2-letter)
+    debug (bool) - Whether to enable debug mode
+    cli (bool) - Whether to print output to CLI
+    pdf (bool) - Whether to generate PDF output
+    output_path (Union[str, os.PathLike]) - Directory path where PDF will be saved
+    pdf_name (str) - File name of the PDF output (default: "Translated_Desc.pdf")
+Return:
+    None
+'''
+def process_text(extracted_text: str,
+                 trans_source: str,
+                 trans_target: str,
+                 debug: bool,
+                 cli: bool,
+                 pdf: bool,
+                 output_path: Union[str, os.PathLike],
+                 pdf_name: str = "Translated_Desc.pdf") -> None:
+    # Parsing extracted text to fill fields
+    log("------------------------------")
+    log("Parsing and Cleaning Routine:")
+    plaque = clean_text(extracted_text, debug)
+    if not plaque.parse_success:
+        raise ValueError(f"Parser failed to find all fields:\n\t{plaque}")
+    log("------------------------------")
+    logger.flush()
+
+    # Text translation
+    log("------------------------------")
+    log("Text translation Routine:")
+    translated = translate_text(plaque, trans_source, trans_target)
+    log("------------------------------")
+    logger.flush()
+
+    # Printing translated description plaque to CLI
+    if cli:
+        log("------------------------------")
+        logger.flush()
+        cli_output(translated)
+        log("------------------------------")
+
+    # Writing PDF output of translated description plaque
+    if pdf:
+        log("------------------------------")
+        log("PDF Output Routine:")
+        pdf_output(translated, output_path, pdf_name)
+        log("------------------------------")
+        logger.flush()
+
+'''
+run_batch()
+Description:
+    Translates every plaque image in a directory. OCR runs concurrently across all images while
+    the translation model loads in the background, then each plaque is parsed, translated, and
+    written out in turn. A plaque that fails to parse is reported and skipped rather than
+    stopping the batch.
+Args:
+    image_dir (str) - Path to the directory of plaque images
+    ocr_source (str) - OCR language code (3-letter)
+    trans_source (str) - Source language translation code (2-letter)
+    trans_target (str) - Target language translation code (2-letter)
+    debug (bool) - Whether to enable debug mode
+    ret_conf (bool) - Whether to return OCR confidence levels
+    cli (bool) - Whether to print output to CLI
+    pdf (bool) - Whether to generate PDF output
+    use_ocr_cache (bool) - Whether to reuse cached OCR results (default: True)
+Return:
+    None
+'''
+def run_batch(image_dir: str,
+              ocr_source: str,
+              trans_source: str,
+              trans_target: str,
+              debug: bool,
+              ret_conf: bool,
+              cli: bool,
+              pdf: bool,
+              use_ocr_cache: bool = True) -> None:
+    # Collect images
+    dir_path = resolve_path(image_dir)
+    if not dir_path.is_dir():
+        raise FileNotFoundError(f"Image directory not found: {dir_path}.")
+    image_paths = sorted(path for path in dir_path.iterdir() if path.suffix.lower() in _IMAGE_EXTS)
+    output_path = _BASE_PATH / "Output_Files"
+
+    # Image preprocessing and extraction for all images at once
+    log("------------------------------")
+    log("Batch Image Pre-Processing and Extraction Routine (%d images):", len(image_paths))
+    # Load the translation model in the background while OCR runs
+    from ocr import extract_itt_batch
+    from translation import warmup as warmup_translation
+    threading.Thread(target=warmup_translation, args=(trans_source, trans_target), daemon=True).start()
+    results = [None] * len(image_paths)
+    cache_keys = [None] * len(image_paths)
+    if use_ocr_cache:
+        for i, path in enumerate(image_paths):
+            try:
+                cache_keys[i] = ocr_cache.make_key(path, ocr_source, ret_conf)
+            except OSError as e:
+                # Unreadable image, reported below like an OCR failure
+                results[i] = e
+                continue
+            # Debug mode re-runs OCR on every image so each preprocessed image is saved
+            results[i] = ocr_cache.get(cache_keys[i]) if not debug else None
+        log("\t* Found %d OCR result(s) in cache.",
+            sum(result is not None and not isinstance(result, Exception) for result in results))
+
+    # OCR the remaining images concurrently
+    misses = [i for i, result in enumerate(results) if result is None]
+    for i, result in zip(misses, extract_itt_batch([image_paths[i] for i in misses], ocr_source, debug, ret_conf)):
+        results[i] = result
+        if use_ocr_cache and not isinstance(result, Exception):
+            ocr_cache.put(cache_keys[i], *result)
+    log("------------------------------")
+    logger.flush()
+
+    for path, result in zip(image_paths, results):
+        log("========== %s ==========", path.name)
+        if isinstance(result, Exception):
+            logger.flush()
+            print(f"\t* OCR failed: {result}")
+            continue
+        extracted_text, avg_conf = result
+        if ret_conf:
+            log("\t* Average confidence level: %.2f%%", avg_conf)
+        try:
+            process_text(extracted_text, trans_source, trans_target, debug, cli, pdf,
+                         output_path, f"{path.stem}_Translated_Desc.pdf")
+        except ValueError as e:
+            logger.flush()
+            print(f"\t* Skipping {path.name}: {e}")
+
 '''
 main()
 Description:
@@ -307,6 +455,8 @@ Args:
     ret_conf (bool) - Whether to return OCR confidence levels
     cli (bool) - Whether to print output to CLI
     pdf (bool) - Whether to generate PDF output
+    image_dir (str, optional) - Directory of plaque images to translate in batch instead of image
+    use_ocr_cache (bool) - Whether to reuse cached OCR results (default: True)
 Return:
     None
 '''
@@ -317,73 +467,52 @@ def main(image: str,
          debug: bool, 
          ret_conf: bool, 
          cli: bool, 
-         pdf: bool) -> None:
+         pdf: bool,
+         image_dir: str = None,
+         use_ocr_cache: bool = True) -> None:
     # Normalizing languages
     ocr_source = lang_converter('ocr', source_lang)
     trans_langs = lang_converter('trans', source_lang, target_lang)
     trans_source = trans_langs[0]
     trans_target = trans_langs[1]
 
-    # Define File Paths
-    base_path = os.getcwd()
-    source_path = base_path + image
-    output_path = base_path + "/Output_Files"
-
-    # Image preprocessing and extraction
-    print("------------------------------")
-    print("Image Pre-Processing and Extraction Routine:")
-    extracted_text, avg_conf = text_extract(source_path, ocr_source, debug, ret_conf)
-    print("------------------------------")
-
-    # Parsing extracted text to fill fields
-    print("------------------------------")
-    print("Parsing and Cleaning Routine:")
-    information = clean_text(extracted_text, debug)
-    if information['parse_success'] != True:
-        raise ValueError(f"Parser failed to find all fields:\n\t{information}")
-    author = information['author']
-    year = information['year']
-    print("------------------------------")
-
-    # Text translation
-    print("------------------------------")
-    print("Text translation Routine:")
-    trans_life_info, trans_title, trans_medium, trans_source, trans_desc = translate_text(
-        information['life_info'],
-        information['title'],
-        information['medium'],
-        information['source'],
-        information['description'],
-        trans_source,
-        trans_target
-    )
-    print("------------------------------")
-
-    # Printing translated description plaque to CLI
-    if cli:
-        print("------------------------------")
-        cli_output(author, trans_life_info, trans_title, year, trans_medium, trans_source, trans_desc)
-        print("------------------------------")
+    # Batch mode
+    if image_dir is not None:
+        run_batch(image_dir, ocr_source, trans_source, trans_target, debug, ret_conf, cli, pdf, use_ocr_cache)
+        return
 
-    # Writing PDF output of translated description plaque
-    if pdf:
-        print("------------------------------")
-        print("PDF Output Routine:")
-        pdf_output(author, trans_life_info, trans_title, year, trans_medium, trans_source, trans_desc, output_path)
-        print("------------------------------")
+    # Define File Paths
+    source_path = resolve_path(image)
+    output_path = _BASE_PATH / "Output_Files"
+
+    # Image preprocessing and extraction (optionally overlapped with loading the translation model)
+    log("------------------------------")
+    log("Image Pre-Processing and Extraction Routine:")
+    if _PRELOAD_TRANSLATION:
+        from translation import warmup as warmup_translation
+        threading.Thread(target=warmup_translation, args=(trans_source, trans_target), daemon=True).start()
+    extracted_text, avg_conf = text_extract(source_path, ocr_source, debug, ret_conf, use_ocr_cache)
+    log("------------------------------")
+    logger.flush()
+
+    # Parsing, translation, and output
+    process_text(extracted_text, trans_source, trans_target, debug, cli, pdf, output_path)
     
     '''
     #TODO: Output .wav File to Output Directory if Requested
     if audio_output:
-        print("Audio Output Routine:")
+        log("Audio Output Routine:")
         audio_output()
     '''
     
 
 if __name__ == "__main__":
-    # CLI Argument Parsing
+    # CLI Argument Parsing (only imported when run as a script)
+    import argparse
     parser = argparse.ArgumentParser(description='Art Museum Description Translator.')
-    parser.add_argument("--image", required=True, help="Path to source image.")
+    source_group = parser.add_mutually_exclusive_group(required=True)
+    source_group.add_argument("--image", help="Path to source image.")
+    source_group.add_argument("--image-dir", help="Path to a directory of source images (batch mode).")
     parser.add_argument("--input-lang", required=True, default="en", help="Original description language.")
     parser.add_argument("--target-lang", default="fr", help="Target translation language")
     parser.add_argument("--audio-output", action='store_true', help="Output audio translation")
@@ -391,10 +520,15 @@ if __name__ == "__main__":
     parser.add_argument("--ret-conf", action='store_true', help="Returns confidence level for OCR")
     parser.add_argument("--cli", action='store_true', help="Prints output to CLI")
     parser.add_argument("--pdf", action='store_true', help="Prints output to PDF")
+    parser.add_argument("--no-ocr-cache", action='store_true', help="Re-runs OCR instead of using cached results")
     args = parser.parse_args()
 
-    if args.debug:
-        print("Arguments:")
-        print("\t" + str(args))
+    logger.set_debug(args.debug)
+    log("Arguments:")
+    log("\t%s", args)
 
-    main(args.image, args.input_lang, args.target_lang, args.audio_output, args.debug, args.ret_conf, args.cli, args.pdf)
\ No newline at end of file
+    try:
+        main(args.image, args.input_lang, args.target_lang, args.audio_output, args.debug, args.ret_conf, args.cli,
+             args.pdf, args.image_dir, not args.no_ocr_cache)
+    finally:
+        logger.flush()
@@ -0,0 +1,76 @@
+'''
+logger.py
+
+Description:
+    This file handles the pipeline's progress messages through the logging module. Messages are
+    only recorded in debug mode (DEBUG level), and are buffered in memory and written to stdout in
+    one call per stage (see flush()) rather than one print() per line. Outside debug mode log()
+    is a single level check, with no formatting and no write.
+
+Author:
+    Magnus Miller
+
+Date Last Updated:
+    01/22/26
+'''
+
+# Importing Libraries
+import io
+import logging
+import sys
+
+# Pending messages, written out by flush()
+_BUF = io.StringIO()
+
+# Pipeline logger: DEBUG in debug mode, WARNING otherwise (progress messages are then dropped by
+# the logger's level check before any formatting)
+_LOGGER = logging.getLogger("art_translator")
+_LOGGER.setLevel(logging.WARNING)
+_LOGGER.propagate = False
+_handler = logging.StreamHandler(_BUF)
+_handler.setFormatter(logging.Formatter("%(message)s"))
+_LOGGER.addHandler(_handler)
+
+'''
+set_debug()
+Description:
+    Turns message logging on or off.
+Args:
+    debug (bool) - If True, messages passed to log() are recorded
+Return:
+    None
+'''
+def set_debug(debug: bool) -> None:
+    _LOGGER.setLevel(logging.DEBUG if debug else logging.WARNING)
+
+'''
+log()
+Description:
+    Records a progress message at DEBUG level. Formatting is deferred (printf-style) so that
+    nothing is formatted when debug mode is off.
+Args:
+    msg (str) - Message, optionally with %-style placeholders
+    *args (Any) - Values for the placeholders
+Return:
+    None
+'''
+log = _LOGGER.debug
+
+'''
+flush()
+Description:
+    Writes all pending messages to stdout in a single write and clears the buffer.
+Args:
+    None
+Return:
+    None
+'''
+def flush() -> None:
+    with _handler.lock:
+        pending = _BUF.getvalue()
+        if pending:
+            _BUF.seek(0)
+            _BUF.truncate()
+    if pending:
+        sys.stdout.write(pending)
+        sys.stdout.flush()
@@ -15,60 +15,76 @@ Date Last Updated:
 
 # Import Libraries
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 import numpy as np
-import cv2
 import pytesseract
 from PIL import Image
-from typing import Union, Tuple, List
+from typing import Union, Tuple, List, Dict, Iterator
 pytesseract.pytesseract.tesseract_cmd = '/opt/homebrew/bin/tesseract'
 
-'''
-img_pre_pro()
-Description:
-    This function handles the pre-processing for OCR. This function converts the image to
-    grayscale, applies small gaussian blur, and applies thresholding for better OCR accuracy.
-Args:
-    source_path (str) - File path to image
-    debug (bool) - Debug saves intermediate images to Debug_Files directory
-Return:
-    np.ndarray - Processed OpenCV image array (grayscale with thresholding applied)
-'''
-def img_pre_pro(source_path: str,
-                debug: bool = False) -> np.ndarray:
+# Optional in-process libtesseract bindings, pytesseract (one subprocess per image) is used without them
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
 
-    # Check if image exists
-    if not os.path.exists(source_path):
-        raise FileNotFoundError(f"Image file not found: {source_path}.")
+# Import Files
+from ocr_preprocess import img_pre_pro
+from logger import log
 
-    # Load file
-    pre_pro_img = cv2.imread(source_path)
-    if pre_pro_img is None:
-        raise ValueError("Image failed to load.")
-    print("\t* Image successfully loaded.")
+# Input is binarized ahead of time, so run the LSTM engine only and skip the inverted-text pass
+TESS_CONFIG = "--oem 1 -c tessedit_do_invert=0"
 
-    # Convert image to grayscale
-    gray_img = cv2.cvtColor(pre_pro_img, cv2.COLOR_BGR2GRAY)
-    print("\t* Image converted to grayscale.")
+# Optional directory of integer-quantized LSTM models (tesseract-ocr/tessdata_fast)
+TESSDATA_FAST_DIR = os.environ.get("TESSDATA_FAST_DIR")
+if TESSDATA_FAST_DIR:
+    TESS_CONFIG += f' --tessdata-dir "{TESSDATA_FAST_DIR}"'
 
-    # Apply Gaussian blur
-    gauss_img = cv2.GaussianBlur(gray_img, (3, 3), 0)
-    print("\t* Gaussian blur applied.")
+# Idle tesserocr API objects per language. An API object must not be used by two threads at once,
+# so each OCR call checks one out and returns it, and engines outlive the thread that made them
+# (e.g. the server's per-request threads)
+_tess_pool: Dict[str, List["tesserocr.PyTessBaseAPI"]] = {}
+_tess_pool_lock = threading.Lock()
 
-    # Apply thresholding
-    thresh_img = cv2.threshold(gauss_img, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)[1]
-    print("\t* Image thresholding applied.")
+# Number of images OCR'd at once in batch mode
+OCR_CONCURRENCY = int(os.environ.get("OCR_CONCURRENCY", os.cpu_count() or 1))
 
-    # Handle returns
-    if debug:
-        cv2.imwrite(os.getcwd() + "/Debug_Files/debug_preprocessed.png", thresh_img)
-        print("\t* Saved debug_preprocessed.png for inspection.")
-
-    return thresh_img
+'''
+tess_api()
+Description:
+    Checks out an idle tesserocr API for a language from the pool for the duration of a with
+    block, initializing a new one (and loading the language model) with the same settings as
+    TESS_CONFIG only when every existing one is in use. The API is returned to the pool afterwards.
+Args:
+    source_lang (str) - Language code for OCR (e.g., 'eng', 'fra', 'deu')
+Return:
+    Iterator[tesserocr.PyTessBaseAPI] - Initialized API object, for use in a with statement
+'''
+@contextmanager
+def tess_api(source_lang: str) -> Iterator["tesserocr.PyTessBaseAPI"]:
+    with _tess_pool_lock:
+        idle = _tess_pool.setdefault(source_lang, [])
+        api = idle.pop() if idle else None
+
+    if api is None:
+        log("\t* Initializing tesserocr for %s.", source_lang)
+        kwargs = {'path': os.path.join(TESSDATA_FAST_DIR, "")} if TESSDATA_FAST_DIR else {}
+        api = tesserocr.PyTessBaseAPI(lang=source_lang, oem=tesserocr.OEM.LSTM_ONLY, **kwargs)
+        api.SetVariable("tessedit_do_invert", "0")
+
+    try:
+        yield api
+    finally:
+        with _tess_pool_lock:
+            _tess_pool[source_lang].append(api)
 
 '''
 run_ocr()
 Description:
-    This function handles running and interacting with the pytesseract ocr library. This
+    This function handles running and interacting with the tesseract ocr library, in process
+    through tesserocr when it is installed and through the pytesseract subprocess otherwise. This
     function will extract the text from the PIL image. If confidence level is requested,
     the function will both extract the text and calculate the average confidence level
     for each line.
@@ -78,42 +94,57 @@ Args:
     ret_conf (bool) - If True, returns text and confidence level; if False, returns text only
 Return:
     List[Union[str, float]] - List containing [extracted_text, avg_conf] where avg_conf is
-                              float if ret_conf=True, or None if ret_conf=False
+                              the average confidence if ret_conf=True, or 0.0 if ret_conf=False
 '''
 def run_ocr(source_lang: str, pil_img: Image, ret_conf: bool = False) -> List[Union[str, float]]:
-    
-    if ret_conf == True:
-        # Get detailed image data
-        print("\t* Running OCR with --oem 3 --psm 4.")
-        img_data = pytesseract.image_to_data(pil_img, lang=source_lang, output_type=pytesseract.Output.DICT)
+
+    if tesserocr is not None:
+        log("\t* Running OCR in process with tesserocr.")
+        with tess_api(source_lang) as api:
+            api.SetImage(pil_img)
+            extracted_text = api.GetUTF8Text()
+            confidences = api.AllWordConfidences() if ret_conf else None
+        if not ret_conf:
+            return [extracted_text, 0.0]
+
+        # Match the pytesseract output: recognized words joined by spaces
+        avg_conf = float(np.mean(confidences)) if confidences else 0.0
+        return [" ".join(extracted_text.split()), avg_conf]
+
+    if ret_conf:
+        # Get detailed image data as raw TSV (pytesseract's Output.DICT converts every cell of every row)
+        log("\t* Running OCR with %s.", TESS_CONFIG)
+        tsv = pytesseract.image_to_data(pil_img, lang=source_lang, config=TESS_CONFIG)
 
         text_lines = []
         confidences = []
 
-        # Extract text and confidences
-        print("\t* Extracting data from image.")
-        for i in range(len(img_data["text"])):
-            if int(img_data["conf"][i]) != -1 and img_data["text"][i]:
-                text_lines.append(img_data["text"][i])
-                confidences.append(float(img_data["conf"][i]))
+        # Extract text and confidences, reading only the last two columns (conf, text).
+        # conf is -1 for layout rows, empty text marks whitespace
+        log("\t* Extracting data from image.")
+        for row in tsv.splitlines()[1:]:
+            cells = row.split('\t')
+            if len(cells) == 12 and cells[10] != '-1' and cells[11].strip():
+                text_lines.append(cells[11])
+                confidences.append(float(cells[10]))
         extracted_text = " ".join(text_lines)
         avg_conf = sum(confidences) / len(confidences) if confidences else 0.0
 
         return [extracted_text, avg_conf]
     else:
-        print("\t* Running OCR.")
-        extracted_text = pytesseract.image_to_string(pil_img, lang=source_lang)
+        log("\t* Running OCR with %s.", TESS_CONFIG)
+        extracted_text = pytesseract.image_to_string(pil_img, lang=source_lang, config=TESS_CONFIG)
 
-        return [extracted_text, None]
+        return [extracted_text, 0.0]
 
 '''
 extract_itt()
 Description:
     This function uses the tesseract ocr library to handle converting the provided
-    image to text. The function serves as a driver and preprocesses the image before
-    using the library.
+    image to text. The function serves as a driver and preprocesses the image (see
+    ocr_preprocess.py) before using the library.
 Args:
-    source_path (str) - File path to image
+    source_path (Union[str, os.PathLike]) - File path to image
     source_lang (str) - Language of source text (e.g., 'eng', 'fra', 'deu')
     debug (bool) - Debug mode saves intermediate images to Debug_Files directory
     ret_conf (bool) - If True, returns text and confidence level; if False, returns text only
@@ -122,7 +153,7 @@ Return:
                         average confidence level as a float (0-100) if ret_conf=True, or 0.0
                         if ret_conf=False
 '''
-def extract_itt(source_path: str,
+def extract_itt(source_path: Union[str, os.PathLike],
                 source_lang: str,
                 debug: bool = False,
                 ret_conf: bool = False) -> Tuple[str, float]:
@@ -130,15 +161,63 @@ def extract_itt(source_path: str,
     # Pre-process source image
     pre_pro_img = img_pre_pro(source_path, debug)
 
-    # Convert pre-processed image to PIL
-    print("\t* Converting image array to PIL")
-    pil_img = Image.fromarray(pre_pro_img)
+    # Pack the 0/255 array straight into a 1-bit PIL image (smaller temp file for tesseract to read),
+    # skipping the 8-bit PIL copy and the dithering pass of Image.convert("1")
+    log("\t* Converting image array to PIL")
+    height, width = pre_pro_img.shape
+    pil_img = Image.frombytes("1", (width, height), np.packbits(pre_pro_img, axis=1).tobytes())
 
     # Run OCR
     extracted_text, avg_conf = run_ocr(source_lang, pil_img, ret_conf)
 
+    return extracted_text, avg_conf
+
+'''
+extract_itt_batch()
+Description:
+    Runs extract_itt() over many images concurrently. Each OCR call spends nearly all of its
+    time in tesseract, either in a pytesseract subprocess or in libtesseract through tesserocr
+    (which releases the GIL while it recognizes), and OpenCV releases the GIL as well, so a
+    thread pool of OCR_CONCURRENCY workers scales with the number of cores. A failing image does
+    not abort the batch; its exception is returned in place of the result.
+Args:
+    source_paths (List[Union[str, os.PathLike]]) - File paths to images
+    source_lang (str) - Language of source text (e.g., 'eng', 'fra', 'deu')
+    debug (bool) - Debug mode saves intermediate images to Debug_Files directory
+    ret_conf (bool) - If True, returns text and confidence level; if False, returns text only
+Return:
+    List[Union[Tuple[str, float], Exception]] - One (extracted_text, avg_conf) tuple per image in
+                                                input order, or the exception raised for that image
+'''
+def extract_itt_batch(source_paths: List[Union[str, os.PathLike]],
+                      source_lang: str,
+                      debug: bool = False,
+                      ret_conf: bool = False) -> List[Union[Tuple[str, float], Exception]]:
+
+    if not source_paths:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(OCR_CONCURRENCY, len(source_paths))) as executor:
+        futures = [executor.submit(extract_itt, path, source_lang, debug, ret_conf) for path in source_paths]
+
     # Handle Returns
-    if ret_conf:
-        return extracted_text, avg_conf
-    else:
-        return extracted_text, avg_conf
\ No newline at end of file
+    results = []
+    for future in futures:
+        exc = future.exception()
+        results.append(exc if exc is not None else future.result())
+    return results
+
+'''
+warmup()
+Description:
+    Runs tesseract once on a tiny blank image so the language model files are loaded into the
+    OS page cache (and, with tesserocr, an API is initialized and left in the pool) before the
+    first real image is processed.
+Args:
+    source_lang (str) - Language of source text (e.g., 'eng', 'fra', 'deu')
+Return:
+    None
+'''
+def warmup(source_lang: str = "eng") -> None:
+    log("\t* Warming up OCR engine.")
+    run_ocr(source_lang, Image.new("1", (32, 32), 1))
@@ -0,0 +1,90 @@
+'''
+ocr_cache.py
+
+Description:
+    This file handles the on-disk cache for OCR results. Extracted text (and confidence level) is
+    stored as a small JSON file keyed by a SHA-1 hash of the image bytes, the OCR language, and the
+    OCR settings, so re-running the pipeline on the same image skips preprocessing and Tesseract.
+
+Author:
+    Magnus Miller
+
+Date Last Updated:
+    01/22/26
+'''
+
+# Importing Libraries
+import hashlib
+import importlib.util
+import json
+import os
+import threading
+from typing import Optional, Tuple, Union
+
+# Cache directory, created on first write
+CACHE_DIR = os.path.join(os.getcwd(), "Cache_Files", "OCR")
+
+# Bump when preprocessing or OCR settings change so stale results are not reused
+OCR_CACHE_VERSION = 2
+
+# OCR backend ocr.py will use, checked without importing it (tesserocr and pytesseract can differ slightly)
+_OCR_BACKEND = "tesserocr" if importlib.util.find_spec("tesserocr") else "pytesseract"
+
+'''
+make_key()
+Description:
+    Builds the cache key for an image. The image is hashed in 1 MB chunks so large photos are never
+    held in memory twice.
+Args:
+    source_path (Union[str, os.PathLike]) - File path to image
+    source_lang (str) - Language code for OCR (e.g., 'eng', 'fra', 'deu')
+    ret_conf (bool) - Whether the confidence level was requested (changes the OCR call used)
+Return:
+    str - Cache key (also used as the cache file name)
+'''
+def make_key(source_path: Union[str, os.PathLike], source_lang: str, ret_conf: bool) -> str:
+    img_hash = hashlib.sha1()
+    with open(source_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            img_hash.update(chunk)
+
+    settings = f"v{OCR_CACHE_VERSION}|{_OCR_BACKEND}|{os.environ.get('TESSDATA_FAST_DIR', '')}"
+    settings_hash = hashlib.sha1(settings.encode("utf-8")).hexdigest()[:8]
+    mode = "conf" if ret_conf else "text"
+    return f"{img_hash.hexdigest()}_{source_lang}_{mode}_{settings_hash}"
+
+'''
+get()
+Description:
+    Looks up a cached OCR result.
+Args:
+    key (str) - Cache key built with make_key()
+Return:
+    Optional[Tuple[str, float]] - Cached (extracted_text, avg_conf), or None on a cache miss
+'''
+def get(key: str) -> Optional[Tuple[str, float]]:
+    try:
+        with open(os.path.join(CACHE_DIR, key + ".json"), 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    return entry['text'], entry['conf']
+
+'''
+put()
+Description:
+    Stores an OCR result. Writes to a temporary file first so readers never see a partial entry.
+Args:
+    key (str) - Cache key built with make_key()
+    extracted_text (str) - Text extracted from the image
+    avg_conf (float) - Average confidence level of the extraction
+Return:
+    None
+'''
+def put(key: str, extracted_text: str, avg_conf: float) -> None:
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = os.path.join(CACHE_DIR, key + ".json")
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'text': extracted_text, 'conf': avg_conf}, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
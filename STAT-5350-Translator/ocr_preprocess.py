@@ -0,0 +1,71 @@
+'''
+ocr_preprocess.py
+
+Description:
+    This file handles the image pre-processing stage ahead of OCR. Images are reduced to a clean
+    binary (black text on white) array with OpenCV so that Tesseract receives an image that
+    needs no further preprocessing and can go straight to its LSTM recognizer.
+
+Author:
+    Magnus Miller
+
+Date Last Updated:
+    01/22/26
+'''
+
+# Import Libraries
+import os
+import numpy as np
+import cv2
+from typing import Union
+
+# Import Files
+from logger import log
+
+# Directory for debug images, resolved once at import
+DEBUG_DIR = os.path.join(os.getcwd(), "Debug_Files")
+
+'''
+img_pre_pro()
+Description:
+    This function handles the pre-processing for OCR. This function loads the image as
+    grayscale, applies small gaussian blur, and applies Otsu thresholding for better OCR accuracy.
+    The result is already binarized, so Tesseract's own thresholding has nothing left to do.
+    Blur and threshold write back into the loaded buffer, so only one image is ever allocated.
+Args:
+    source_path (Union[str, os.PathLike]) - File path to image
+    debug (bool) - Debug saves the preprocessed image to Debug_Files/debug_<image name>.png
+Return:
+    np.ndarray - Processed OpenCV image array (binary, values 0 or 255)
+'''
+def img_pre_pro(source_path: Union[str, os.PathLike],
+                debug: bool = False) -> np.ndarray:
+
+    # Load file straight to grayscale (decoder converts, no separate BGR buffer). The bytes are
+    # read with numpy and decoded in memory, which also works for non-ASCII paths on Windows
+    try:
+        file_bytes = np.fromfile(os.fspath(source_path), dtype=np.uint8)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Image file not found: {source_path}.")
+    gray_img = cv2.imdecode(file_bytes, cv2.IMREAD_GRAYSCALE) if file_bytes.size else None
+    if gray_img is None:
+        raise ValueError("Image failed to load.")
+    log("\t* Image successfully loaded as grayscale.")
+
+    # Apply Gaussian blur (in place)
+    cv2.GaussianBlur(gray_img, (3, 3), 0, dst=gray_img)
+    log("\t* Gaussian blur applied.")
+
+    # Apply thresholding (in place)
+    cv2.threshold(gray_img, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU, dst=gray_img)
+    thresh_img = gray_img
+    log("\t* Image thresholding applied.")
+
+    # Handle returns
+    if debug:
+        # Named after the source image, so concurrent batch workers never write the same file
+        debug_name = f"debug_{os.path.splitext(os.path.basename(source_path))[0]}.png"
+        cv2.imwrite(os.path.join(DEBUG_DIR, debug_name), thresh_img)
+        log("\t* Saved %s for inspection.", debug_name)
+
+    return thresh_img
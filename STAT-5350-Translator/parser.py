@@ -18,84 +18,129 @@ Date Last Updated:
 
 # Importing Libraries
 import re
-from typing import Dict, Any
+from dataclasses import dataclass
+from typing import List
+
+# Import Files
+from logger import log
+
+'''
+Plaque
+Description:
+    Structured fields of a museum plaque. Instances are immutable; use dataclasses.replace() to
+    derive a translated copy. __slots__ is declared by hand (dataclass slots=True needs
+    Python 3.10+) so a plaque carries no per-instance __dict__.
+Fields:
+    author (str) - Artist's name
+    life_info (str) - Artist's life dates (e.g., "1881-1973")
+    title (str) - Title of the artwork
+    year (str) - Year artwork was created (e.g., "1923")
+    medium (str) - Medium/materials used
+    source (str) - Credit line/provenance
+    description (str) - Description of the artwork
+    parse_success (bool) - Whether parsing found all required fields
+    raw_text (str) - Original unprocessed text for reference
+'''
+@dataclass(frozen=True)
+class Plaque:
+    __slots__ = ('author', 'life_info', 'title', 'year', 'medium', 'source', 'description',
+                 'parse_success', 'raw_text')
+
+    # Fields that are translated (author and year are kept as-is)
+    TRANSLATED_FIELDS = ('life_info', 'title', 'medium', 'source', 'description')
+
+    author: str
+    life_info: str
+    title: str
+    year: str
+    medium: str
+    source: str
+    description: str
+    parse_success: bool
+    raw_text: str
+
+# Plaque fields in the order they appear on a plaque
+FIELDS = ('author', 'life_info', 'title', 'year', 'medium', 'source', 'description')
+
+# Whether each field starts after a blank line (True), directly below the previous one (False),
+# or either (None)
+FIELD_AFTER_BLANK = (None, False, True, False, True, True, True)
+
+# One plaque line: no surrounding whitespace and no line break splitlines() would split on
+_LINE = r"\S(?:[^\n\r\v\f\x1c-\x1e\x85\u2028\u2029]*\S)?"
+
+# Cleanly laid out plaque (single blank lines between groups, description running to the end),
+# matched in one pass. Anything else goes through the line scanner, which gives the same fields
+# for text this pattern matches
+PLAQUE_RE = re.compile(
+    rf"(?P<author>{_LINE})\n(?P<life_info>{_LINE})\n\n"
+    rf"(?P<title>{_LINE})\n(?P<year>{_LINE})\n\n"
+    rf"(?P<medium>{_LINE})\n\n"
+    rf"(?P<source>{_LINE})\n\n"
+    rf"(?P<description>{_LINE}(?:\n{_LINE})*)"
+)
 
 '''
 parse_text()
 Description:
     Parses raw OCR output into structured plaque fields. Uses line-based parsing to extract
     information in a typical museum plaque format: author name, life dates, artwork title,
-    year created, medium, source/credit line, and description.
+    year created, medium, source/credit line, and description. Cleanly laid out text is
+    matched with PLAQUE_RE in one pass before falling back to the line scanner.
 Args:
     raw_text (str) - The full text string returned from OCR
     debug (bool) - If True, prints intermediate parsing steps to console
 Return:
-    Dict[str, Any] - Dictionary containing the following keys:
-        - 'author' (str): Artist's name
-        - 'life_info' (str): Artist's life dates (e.g., "1881-1973")
-        - 'title' (str): Title of the artwork
-        - 'year' (str): Year artwork was created (e.g., "1923")
-        - 'medium' (str): Medium/materials used
-        - 'source' (str): Credit line/provenance
-        - 'description' (str): Description of the artwork
-        - 'parse_success' (bool): Whether parsing found all required fields
-        - 'raw_text' (str): Original unprocessed text for reference
+    Plaque - Parsed plaque fields, with parse_success set if all fields were found
 '''
-def parse_text(raw_text: str, debug: bool) -> Dict[str, Any]:
-    # Define information dictionary
-    information: Dict[str, Any] = {
-        'author': '',
-        'life_info': '',
-        'title': '',
-        'year': '',
-        'medium': '',
-        'source': '',
-        'description': '',
-        'parse_success': False,
-        'raw_text': raw_text
-    }
+def parse_text(raw_text: str, debug: bool) -> Plaque:
+    # Field values in FIELDS order (the same order as Plaque's fields), filled in as the lines are read
+    values = [''] * len(FIELDS)
     
-    # Check if text has been passed
-    if not raw_text.strip():
+    # Check if text has been passed (stripped once, surrounding blank lines never hold a field)
+    text = raw_text.strip()
+    if not text:
         if debug:
-            print("\t* No text provided to parse and clean.")
-        return information
+            log("\t* No text provided to parse and clean.")
+        return Plaque(*values, parse_success=False, raw_text=raw_text)
     
-    lines = [line.strip() for line in raw_text.split('\n')]
-    
-    print("\t* Parsing extracted text.")
+    log("\t* Parsing extracted text.")
+    match = PLAQUE_RE.fullmatch(text)
+    if match:
+        log("\t* Successfully parsed extracted text. All fields collected.")
+        return Plaque(*match.groups(), parse_success=True, raw_text=raw_text)
+
+    state = 0
     last_line_blank = True
-    for i in range(len(lines)):
-        if lines[i] != '':
-            if information['author'] == '':
-                information['author'] = lines[i]
-                last_line_blank = False
-            elif information['life_info'] == '' and last_line_blank == False:
-                information['life_info'] = lines[i]
-                last_line_blank = False
-            elif information['title'] == '' and last_line_blank == True:
-                information['title'] = lines[i]
-                last_line_blank = False
-            elif information['year'] == '' and last_line_blank == False:
-                information['year'] = lines[i]
-                last_line_blank = False
-            elif information['medium'] == '' and last_line_blank == True:
-                information['medium'] = lines[i]
-                last_line_blank = False
-            elif information['source'] == '' and last_line_blank == True:
-                information['source'] = lines[i]
-                last_line_blank = False
-            elif information['description'] == '' and last_line_blank == True:
-                information['description'] = lines[i]
-                last_line_blank = False
-            elif information['description'] != '' and last_line_blank == False:
-                information['description'] = information['description'] + '\n' + lines[i]
-                last_line_blank = False
-        else:
+    desc_parts: List[str] = []
+    filled = 0
+    for line in text.splitlines():
+        line = line.strip()
+        if line == '':
             last_line_blank = True
+            continue
+
+        if state < len(FIELDS):
+            # Fill the next field whose layout rule matches, skipping any that cannot
+            for k in range(state, len(FIELDS)):
+                if FIELD_AFTER_BLANK[k] is None or FIELD_AFTER_BLANK[k] == last_line_blank:
+                    values[k] = line
+                    state = k + 1
+                    filled += 1
+                    break
+        elif last_line_blank:
+            # Description ended at the blank line, nothing after it belongs to the plaque
+            break
+        else:
+            # Description continues until the next blank line (joined once after the loop)
+            desc_parts.append(line)
+        last_line_blank = False
+
+    if desc_parts:
+        values[-1] = '\n'.join([values[-1]] + desc_parts)
 
-    if all(value != '' for value in information.values()):
-        print("\t* Successfully parsed extracted text. All fields collected.")
-        information['parse_success'] = True
+    parse_success = filled == len(FIELDS)
+    if parse_success:
+        log("\t* Successfully parsed extracted text. All fields collected.")
 
-    return information
\ No newline at end of file
+    return Plaque(*values, parse_success=parse_success, raw_text=raw_text)
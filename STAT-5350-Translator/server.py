@@ -0,0 +1,266 @@
+'''
+server.py
+
+Description:
+    This file serves the translation pipeline over HTTP for deployments that translate many plaques.
+    Translation requests that arrive within a short window are collected by a single batch worker
+    and sent to the model as one batch, so concurrent requests share forward passes instead of
+    queueing one after another. Models are loaded and warmed up once at startup.
+
+    Endpoints (JSON in, JSON out):
+        POST /translate - {"texts": [...], "source": "en", "target": "fr"}
+                          -> {"translations": [...]}
+        POST /plaque    - {"image": "<path under SERVER_IMAGE_ROOT>", "ocr_lang": "eng", "source": "en", "target": "fr"}
+                          -> {"author": ..., "life_info": ..., "title": ..., "year": ..., "medium": ...,
+                              "source": ..., "description": ...}
+
+Author:
+    Magnus Miller
+
+Date Last Updated:
+    01/22/26
+'''
+
+# Import Libraries
+import argparse
+import json
+import os
+import queue
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Dict, List, Any, Optional
+
+# Import Files
+from ocr import extract_itt, warmup as warmup_ocr
+from translation import translate, warmup as warmup_translation
+from parser import parse_text, Plaque
+
+# Batching parameters
+MAX_BATCH = int(os.environ.get("SERVER_MAX_BATCH", 32))
+BATCH_WINDOW = float(os.environ.get("SERVER_BATCH_WINDOW", 0.03))
+
+# Directory /plaque images are read from (client paths are relative to it and may not leave it)
+IMAGE_ROOT = os.path.realpath(os.environ.get("SERVER_IMAGE_ROOT", os.path.join(os.getcwd(), "Input_Files")))
+
+# Pending translation jobs, consumed by batch_worker()
+_jobs: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+
+'''
+submit_translation()
+Description:
+    Queues texts for the batch worker and blocks until they have been translated.
+Args:
+    texts (List[str]) - Texts to be translated
+    source_lang (str) - Source language code (2-letter ISO code)
+    target_lang (str) - Target language code (2-letter ISO code)
+    split_sentences (Optional[List[bool]]) - Per text, whether to translate it sentence by sentence
+                                             (default: None, no text is split)
+Return:
+    List[str] - Translated texts in input order
+'''
+def submit_translation(texts: List[str], source_lang: str, target_lang: str,
+                       split_sentences: Optional[List[bool]] = None) -> List[str]:
+    job = {
+        'texts': texts,
+        'split': split_sentences if split_sentences is not None else [False] * len(texts),
+        'source': source_lang,
+        'target': target_lang,
+        'done': threading.Event(),
+        'result': None,
+        'error': None,
+    }
+    _jobs.put(job)
+    job['done'].wait()
+    if job['error'] is not None:
+        raise job['error']
+    return job['result']
+
+'''
+batch_worker()
+Description:
+    Runs forever on a background thread. Waits for a job, keeps collecting jobs for up to
+    BATCH_WINDOW seconds (or until MAX_BATCH jobs are waiting), then translates every job for the
+    same language pair with a single translate() call and hands each job its slice of the results.
+    If the shared call fails, the jobs are retried one by one so an error only reaches the job
+    that caused it.
+Args:
+    None
+Return:
+    None
+'''
+def batch_worker() -> None:
+    while True:
+        batch = [_jobs.get()]
+        deadline = time.monotonic() + BATCH_WINDOW
+        while len(batch) < MAX_BATCH:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_jobs.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        # One model call per language pair
+        groups: Dict[tuple, List[Dict[str, Any]]] = {}
+        for job in batch:
+            groups.setdefault((job['source'], job['target']), []).append(job)
+
+        for (source_lang, target_lang), jobs in groups.items():
+            texts = [text for job in jobs for text in job['texts']]
+            split = [flag for job in jobs for flag in job['split']]
+            try:
+                results = translate(texts, source_lang, target_lang, split_sentences=split)
+            except Exception as e:
+                if len(jobs) == 1:
+                    jobs[0]['error'] = e
+                    jobs[0]['done'].set()
+                    continue
+
+                # Retry each job on its own
+                for job in jobs:
+                    try:
+                        job['result'] = translate(job['texts'], source_lang, target_lang,
+                                                  split_sentences=job['split'])
+                    except Exception as job_error:
+                        job['error'] = job_error
+                    job['done'].set()
+                continue
+
+            pos = 0
+            for job in jobs:
+                job['result'] = results[pos:pos + len(job['texts'])]
+                pos += len(job['texts'])
+                job['done'].set()
+
+'''
+handle_translate()
+Description:
+    Handles a POST /translate request body.
+Args:
+    body (Dict[str, Any]) - Parsed JSON request body
+Return:
+    Dict[str, Any] - JSON response body
+'''
+def handle_translate(body: Dict[str, Any]) -> Dict[str, Any]:
+    texts = body['texts']
+    if isinstance(texts, str):
+        texts = [texts]
+    if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+        raise ValueError("'texts' must be a string or a list of strings")
+    translations = submit_translation(texts, body.get('source', 'en'), body.get('target', 'fr'))
+    return {'translations': translations}
+
+'''
+resolve_image()
+Description:
+    Resolves a client-supplied image path against IMAGE_ROOT, so /plaque can only read images
+    inside that directory.
+Args:
+    image (Any) - Image path from the request body
+Return:
+    str - Absolute path of the image
+'''
+def resolve_image(image: Any) -> str:
+    if not isinstance(image, str):
+        raise ValueError("'image' must be a path string")
+    path = os.path.realpath(os.path.join(IMAGE_ROOT, image))
+    if os.path.commonpath([IMAGE_ROOT, path]) != IMAGE_ROOT:
+        raise ValueError(f"Image path is outside the image root: {image}")
+    return path
+
+'''
+handle_plaque()
+Description:
+    Handles a POST /plaque request body. OCR and parsing run on the request thread, the parsed
+    fields are then translated through the shared batch worker.
+Args:
+    body (Dict[str, Any]) - Parsed JSON request body
+Return:
+    Dict[str, Any] - JSON response body
+'''
+def handle_plaque(body: Dict[str, Any]) -> Dict[str, Any]:
+    extracted_text, _ = extract_itt(resolve_image(body['image']), body.get('ocr_lang', 'eng'))
+    plaque = parse_text(extracted_text, False)
+    if not plaque.parse_success:
+        raise ValueError(f"Parser failed to find all fields:\n\t{plaque}")
+
+    fields = Plaque.TRANSLATED_FIELDS
+    translations = submit_translation([getattr(plaque, field) for field in fields],
+                                      body.get('source', 'en'), body.get('target', 'fr'),
+                                      [field == 'description' for field in fields])
+    response = {'author': plaque.author, 'year': plaque.year}
+    response.update(zip(fields, translations))
+    return response
+
+# Routes
+_ROUTES = {
+    '/translate': handle_translate,
+    '/plaque': handle_plaque,
+}
+
+class RequestHandler(BaseHTTPRequestHandler):
+    def do_POST(self) -> None:
+        route = _ROUTES.get(self.path)
+        if route is None:
+            self.send_json(404, {'error': f"Unknown endpoint: {self.path}"})
+            return
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            body = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(body, dict):
+                raise ValueError("Request body must be a JSON object")
+            self.send_json(200, route(body))
+        except (KeyError, ValueError, FileNotFoundError) as e:
+            self.send_json(400, {'error': str(e)})
+        except Exception as e:
+            self.send_json(500, {'error': str(e)})
+
+    def send_json(self, status: int, payload: Dict[str, Any]) -> None:
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+'''
+serve()
+Description:
+    Warms up the models, starts the batch worker, and serves requests until interrupted.
+Args:
+    host (str) - Interface to bind to
+    port (int) - Port to listen on
+    ocr_lang (str) - OCR language code (3-letter) to warm up
+    source_lang (str) - Source language code (2-letter) to warm up
+    target_lang (str) - Target language code (2-letter) to warm up
+Return:
+    None
+'''
+def serve(host: str, port: int, ocr_lang: str, source_lang: str, target_lang: str) -> None:
+    print("Warming up models:")
+    warmup_ocr(ocr_lang)
+    warmup_translation(source_lang, target_lang)
+
+    threading.Thread(target=batch_worker, daemon=True).start()
+    httpd = ThreadingHTTPServer((host, port), RequestHandler)
+    print(f"Serving on http://{host}:{port} (batch window {BATCH_WINDOW * 1000:.0f} ms, max batch {MAX_BATCH})")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+
+if __name__ == "__main__":
+    # CLI Argument Parsing
+    parser = argparse.ArgumentParser(description='Art Museum Description Translator server.')
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind to")
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on")
+    parser.add_argument("--ocr-lang", default="eng", help="OCR language to warm up (3-letter code)")
+    parser.add_argument("--source-lang", default="en", help="Source translation language to warm up (2-letter code)")
+    parser.add_argument("--target-lang", default="fr", help="Target translation language to warm up (2-letter code)")
+    args = parser.parse_args()
+
+    serve(args.host, args.port, args.ocr_lang, args.source_lang, args.target_lang)
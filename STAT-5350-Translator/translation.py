@@ -3,7 +3,7 @@ translation.py
 
 Description:
     This file handles the translation of the raw description plaque text extracted using OCR into the target
-    language specified by the user. Uses HuggingFace transformers pipeline with Helsinki-NLP models
+    language specified by the user. Uses HuggingFace transformers models from Helsinki-NLP
     or falls back to NLLB multilingual models.
 
 Author:
@@ -14,107 +14,457 @@ Date Last Updated:
 '''
 
 # Importing Libraries
-from typing import Union, Tuple, Any
-from transformers import pipeline
+from typing import Union, Tuple, List, Dict, Any, Optional
+import os
+import re
+import threading
 import warnings
-import torch
+# torch and transformers take seconds to import, so they are only imported in get_trans_pipe()
+# when a model is actually needed (text found in the translation cache never loads them)
+
+# Import Files
+import translation_cache
+from logger import log
 
 # Suppress warnings for cleaner CLI
 warnings.filterwarnings("ignore", category=UserWarning)
 
-# Load translator pipeline for faster runtime
-_translator = None
+# Largest number of texts per forward pass (bigger batches are split, shortest texts first)
+BATCH_SIZE = int(os.environ.get("TRANSLATION_BATCH_SIZE", 16))
+
+# Abbreviations whose period does not end a sentence (single letters such as initials and "c."
+# for circa are never treated as sentence ends either)
+NO_SPLIT_AFTER = ("Mr", "Mrs", "Ms", "Dr", "St", "Jr", "Sr", "ca", "no", "No")
+
+# Sentence boundary: whitespace after ., ! or ? (captured so the original separator is kept),
+# except after an abbreviation or a single letter
+SENTENCE_END_RE = re.compile(
+    r"(?<=[.!?])(?<!\b\w\.)" + "".join(rf"(?<!\b{abbr}\.)" for abbr in NO_SPLIT_AFTER) + r"(\s+)"
+)
+
+# Beam width for decoding; 1 (greedy) is several times faster than the opus-mt default of 4-6
+# and loses very little quality on short plaque text
+NUM_BEAMS = int(os.environ.get("TRANSLATION_NUM_BEAMS", 1))
+
+# CPU threads per translation forward pass. Plaque texts are short, so more threads mostly add
+# dispatch overhead (and compete with OCR workers in batch mode)
+NUM_THREADS = int(os.environ.get("TRANSLATION_THREADS", min(4, os.cpu_count() or 1)))
+
+# Optional directory of opus-mt models converted for CTranslate2, one subdirectory per model
+# named like the HuggingFace model (e.g. $CT2_MODEL_DIR/opus-mt-en-fr), see README
+CT2_MODEL_DIR = os.environ.get("CT2_MODEL_DIR")
+
+# Optional directory of models exported to ONNX with optimum (used on CPU), laid out like CT2_MODEL_DIR
+ORT_MODEL_DIR = os.environ.get("ORT_MODEL_DIR")
+
+# Run the model with int8 weights on CPU (set TRANSLATION_QUANTIZE=0 for full FP32 precision)
+QUANTIZE = os.environ.get("TRANSLATION_QUANTIZE", "1") != "0"
+
+# Multilingual model used when no opus-mt model exists for a language pair
+NLLB_MODEL = "facebook/nllb-200-distilled-600M"
+
+# NLLB language tokens for the 2-letter codes (other codes fall back to "<code>_Latn")
+NLLB_LANG_CODES = {
+    "en": "eng_Latn", "fr": "fra_Latn", "de": "deu_Latn", "es": "spa_Latn", "it": "ita_Latn",
+    "zh": "zho_Hans", "ja": "jpn_Jpan", "ru": "rus_Cyrl",
+    # Add more as your project needs
+}
+
+# Forced BOS token id per target language, filled from the NLLB tokenizer when it is loaded
+_nllb_bos_ids: Dict[str, int] = {}
+
+# Loaded translators keyed by (source_lang, target_lang), kept for the lifetime of the process.
+# Every pair that falls back to NLLB shares the single _nllb_translator
+_translators: Dict[Tuple[str, str], Any] = {}
+_nllb_translator = None
+# Guards lazy pipeline construction when translate() is called from multiple threads
+_translator_lock = threading.Lock()
+
+'''
+from_pretrained()
+Description:
+    Loads a tokenizer or model from the local HuggingFace cache without touching the network,
+    and only goes to the hub (which downloads and caches it) when it has not been downloaded yet.
+    Saves the hub's metadata requests on every run after the first.
+Args:
+    loader (Any) - transformers Auto class to load with (e.g. AutoTokenizer)
+    model (str) - Model identifier string for HuggingFace transformers
+Return:
+    Any - Loaded tokenizer or model
+'''
+def from_pretrained(loader: Any, model: str) -> Any:
+    try:
+        return loader.from_pretrained(model, local_files_only=True)
+    except OSError:
+        log("\t* %s not in local cache, downloading.", model)
+        return loader.from_pretrained(model)
+
+'''
+HFTranslator
+Description:
+    Runs a HuggingFace seq2seq translation model by calling tokenizer and model.generate()
+    directly. Takes a list of texts and returns [{"translation_text": ...}] like a transformers
+    translation pipeline, without the pipeline's per-call preprocessing and postprocessing.
+    Generation runs under torch.inference_mode(). Works with PyTorch models and with optimum's
+    ONNX Runtime models, which share the generate() API.
+Args:
+    tokenizer (Any) - Loaded HuggingFace tokenizer
+    model (Any) - Loaded seq2seq model (in eval mode), already on the device
+    device (str) - Torch device to run on ("cuda" or "cpu")
+    settings (str) - What runs the model, for the translation cache key
+                     ("<model>|<backend>|<device>|<precision>")
+'''
+class HFTranslator:
+    def __init__(self, tokenizer: Any, model: Any, device: str, settings: str) -> None:
+        self.tokenizer = tokenizer
+        self.model = model
+        self.device = device
+        self.settings = settings
+
+    def __call__(self, texts: List[str], max_length: int = 512, batch_size: int = BATCH_SIZE,
+                 num_beams: int = NUM_BEAMS, **generate_kwargs) -> List[dict]:
+        import torch
+        # Inputs are truncated to, and output capped at, the length the model was trained for
+        max_length = min(max_length, self.tokenizer.model_max_length)
+        translations = []
+        for start in range(0, len(texts), batch_size):
+            inputs = self.tokenizer(texts[start:start + batch_size], return_tensors="pt", padding=True,
+                                    truncation=True).to(self.device)
+            with torch.inference_mode():
+                outputs = self.model.generate(**inputs, max_length=max_length, num_beams=num_beams,
+                                              do_sample=False, **generate_kwargs)
+            translations.extend(self.tokenizer.batch_decode(outputs, skip_special_tokens=True))
+        return [{"translation_text": text} for text in translations]
+
+'''
+CT2Pipeline
+Description:
+    Runs an opus-mt model converted with ct2-transformers-converter on the CTranslate2 C++
+    decoder (quantized weights, fused kernels) with the same call signature and output format
+    as HFTranslator, so translate() can use either. The HuggingFace tokenizer is still used to
+    split text into subword tokens and join the output back.
+Args:
+    model_dir (str) - Directory of the converted CTranslate2 model
+    model (str) - HuggingFace model identifier the model was converted from (for the tokenizer)
+'''
+class CT2Pipeline:
+    def __init__(self, model_dir: str, model: str) -> None:
+        import ctranslate2
+        from transformers import AutoTokenizer
+        device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+        compute_type = ("int8" if device == "cpu" else "int8_float16") if QUANTIZE else "default"
+        self.translator = ctranslate2.Translator(model_dir, device=device, compute_type=compute_type,
+                                                 intra_threads=NUM_THREADS)
+        self.tokenizer = from_pretrained(AutoTokenizer, model)
+        self.settings = f"{model}|ct2|{device}|{compute_type}"
+
+    def __call__(self, texts: List[str], max_length: int = 512, batch_size: int = BATCH_SIZE,
+                 num_beams: int = NUM_BEAMS) -> List[dict]:
+        max_length = min(max_length, self.tokenizer.model_max_length)
+        sources = [self.tokenizer.convert_ids_to_tokens(ids)
+                   for ids in self.tokenizer(texts, truncation=True).input_ids]
+        results = self.translator.translate_batch(
+            sources,
+            max_batch_size=batch_size,
+            beam_size=num_beams,
+            max_decoding_length=max_length
+        )
+        return [
+            {"translation_text": self.tokenizer.decode(
+                self.tokenizer.convert_tokens_to_ids(result.hypotheses[0]), skip_special_tokens=True)}
+            for result in results
+        ]
+
+'''
+is_nllb()
+Description:
+    Checks whether a translator is the multilingual NLLB fallback, which needs the target
+    language passed as a forced BOS token.
+Args:
+    translator (Any) - Translator returned by get_trans_pipe()
+Return:
+    bool - True for the NLLB pipeline
+'''
+def is_nllb(translator: Any) -> bool:
+    return not isinstance(translator, CT2Pipeline) and "nllb" in translator.model.config._name_or_path
+
+'''
+build_pipeline()
+Description:
+    Loads a HuggingFace translation model on the given device. On CPU, an ONNX export of the
+    model in ORT_MODEL_DIR is run on ONNX Runtime when one exists; otherwise the PyTorch model's
+    Linear layers are dynamically quantized to int8 unless TRANSLATION_QUANTIZE=0.
+Args:
+    model (str) - Model identifier string for HuggingFace transformers
+    device (str) - Torch device to run on ("cuda" or "cpu")
+Return:
+    HFTranslator - Loaded translator
+'''
+def build_pipeline(model: str, device: str) -> HFTranslator:
+    from transformers import AutoTokenizer
+    tokenizer = from_pretrained(AutoTokenizer, model)
+
+    ort_dir = os.path.join(ORT_MODEL_DIR, model.split("/")[-1]) if ORT_MODEL_DIR else None
+    if device == "cpu" and ort_dir and os.path.isdir(ort_dir):
+        from optimum.onnxruntime import ORTModelForSeq2SeqLM
+        log("\t* Loading ONNX Runtime translation model: %s.", ort_dir)
+        return HFTranslator(tokenizer, ORTModelForSeq2SeqLM.from_pretrained(ort_dir), device,
+                            f"{model}|ort|cpu|fp32")
+
+    import torch
+    from transformers import AutoModelForSeq2SeqLM
+    log("\t* Loading translation model: %s.", model)
+    seq2seq = from_pretrained(AutoModelForSeq2SeqLM, model).to(device).eval()
+
+    # Decoding on CPU is bound by weight loads, int8 Linear weights halve that traffic
+    precision = "fp32"
+    if device == "cpu" and QUANTIZE:
+        log("\t* Quantizing translation model to int8.")
+        seq2seq = torch.ao.quantization.quantize_dynamic(seq2seq, {torch.nn.Linear}, dtype=torch.qint8)
+        precision = "int8"
+    return HFTranslator(tokenizer, seq2seq, device, f"{model}|torch|{device}|{precision}")
+
+'''
+translator_config()
+Description:
+    Describes the configuration that decides how a model is run (model directories present,
+    TRANSLATION_QUANTIZE). Runs with the same configuration resolve to the same translator, so
+    its settings are recorded under this description (see get_trans_pipe()).
+Args:
+    model (str) - Model identifier string for HuggingFace transformers
+Return:
+    str - Configuration description
+'''
+def translator_config(model: str) -> str:
+    present = [
+        f"{name}={int(bool(base) and os.path.isdir(os.path.join(base, model_id.split('/')[-1])))}"
+        for name, base, model_id in (("ct2", CT2_MODEL_DIR, model), ("ort", ORT_MODEL_DIR, model),
+                                     ("ort_nllb", ORT_MODEL_DIR, NLLB_MODEL))
+    ]
+    return "|".join([model] + present + [f"quantize={int(QUANTIZE)}"])
+
+'''
+translator_settings()
+Description:
+    Returns the settings of the translator a language pair runs on (model actually used, including
+    the NLLB fallback, backend, device and precision) without loading it: from the loaded
+    translator, or as recorded by an earlier run with the same configuration.
+Args:
+    source_lang (str) - Source language code (2-letter ISO code)
+    target_lang (str) - Target language code (2-letter ISO code)
+    model (str) - Model identifier string for HuggingFace transformers
+Return:
+    Optional[str] - Translator settings, or None if this configuration has never been loaded
+'''
+def translator_settings(source_lang: str, target_lang: str, model: str) -> Optional[str]:
+    translator = _translators.get((source_lang, target_lang))
+    if translator is not None:
+        return translator.settings
+    return translation_cache.get_resolved(translator_config(model))
 
 '''
 get_trans_pipe()
 Description:
-    Initializes and returns a translation pipeline. Uses Helsinki-NLP opus-mt models for
-    specific language pairs, or falls back to NLLB multilingual model if specific model
-    is not available. Uses GPU if available, otherwise uses CPU.
+    Initializes and returns the translation pipeline for a language pair. Uses Helsinki-NLP
+    opus-mt models for specific language pairs, or falls back to NLLB multilingual model if
+    specific model is not available. If a CTranslate2 conversion of the opus-mt model exists in
+    CT2_MODEL_DIR, it is run on CTranslate2 instead (see CT2Pipeline). Uses GPU if available,
+    otherwise uses CPU (for the fallback model too) with NUM_THREADS threads. Each pair is only
+    loaded once and reused by every translate() call, and all pairs without an opus-mt model
+    share one NLLB pipeline. Safe to call from multiple threads.
 Args:
     source_lang (str) - Source language code (2-letter ISO code)
     target_lang (str) - Target language code (2-letter ISO code)
     model (str) - Model identifier string for HuggingFace transformers
 Return:
-    Any - HuggingFace transformers pipeline object for translation
+    Any - HFTranslator (or CT2Pipeline) for translation
 '''
 def get_trans_pipe(source_lang: str,
                    target_lang: str,
                    model: str) -> Any:
-    global _translator
-
-    if _translator is None:
-        try:
-            print(f"\t* Loading translation model: {model}.")
-            _translator = pipeline(
-                "translation", 
-                model=model, 
-                tokenizer=model, 
-                device=0 if torch.cuda.is_available() else -1
-            )
-        except Exception as e:
-            print(f"Model {model} not found or failed to load: {e}")
-            print("Falling back to multilingual NLLB-distilled (slower but broader support)")
-            _translator = pipeline(
-                "translation", 
-                model="facebook/nllb-200-distilled-600M", 
-                tokenizer="facebook/nllb-200-distilled-600M"
-            )
-    return _translator
+    global _nllb_translator
+
+    key = (source_lang, target_lang)
+    translator = _translators.get(key)
+    if translator is not None:
+        return translator
+
+    with _translator_lock:
+        # Re-check: another thread may have built the pipeline while we waited
+        if key in _translators:
+            return _translators[key]
+
+        ct2_dir = os.path.join(CT2_MODEL_DIR, model.split("/")[-1]) if CT2_MODEL_DIR else None
+        if ct2_dir and os.path.isdir(ct2_dir):
+            log("\t* Loading CTranslate2 translation model: %s.", ct2_dir)
+            translator = CT2Pipeline(ct2_dir, model)
+        else:
+            # OpenMP/MKL read their thread counts when torch is first imported
+            os.environ.setdefault("OMP_NUM_THREADS", str(NUM_THREADS))
+            os.environ.setdefault("MKL_NUM_THREADS", str(NUM_THREADS))
+            import torch
+            # Resolved once, the fallback model goes on the same device
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+            if device == "cpu":
+                torch.set_num_threads(NUM_THREADS)
+                try:
+                    torch.set_num_interop_threads(1)
+                except RuntimeError:
+                    # Only allowed before torch has run any parallel work
+                    pass
+            try:
+                translator = build_pipeline(model, device)
+            except Exception as e:
+                print(f"Model {model} not found or failed to load: {e}")
+                print("Falling back to multilingual NLLB-distilled (slower but broader support)")
+                if _nllb_translator is None:
+                    _nllb_translator = build_pipeline(NLLB_MODEL, device)
+                    _nllb_bos_ids.update({
+                        code: _nllb_translator.tokenizer.convert_tokens_to_ids(token)
+                        for code, token in NLLB_LANG_CODES.items()
+                    })
+                translator = _nllb_translator
+
+        _translators[key] = translator
+        # Later runs key the cache on this translator without loading it (see translator_settings())
+        translation_cache.put_resolved(translator_config(model), translator.settings)
+    return translator
 
 '''
 translate()
 Description:
     Translates text from source language to target language using HuggingFace transformers.
     Automatically handles model selection and special token requirements for different model types.
+    Accepts either a single string or a list of strings; a list is sent through the pipeline
+    in batches (sorted by length to minimize padding) so entries share forward passes, and
+    identical entries are only translated once. Texts marked with split_sentences (plaque
+    descriptions) are split into sentences that are translated in the same batch and joined back
+    together. Results are cached on disk, so text that has been translated before is returned
+    without loading the model.
 Args:
-    raw_text (str) - Text to be translated
+    raw_text (Union[str, List[str]]) - Text (or list of texts) to be translated
     source_lang (str) - Source language code (2-letter ISO code, default: "en")
     target_lang (str) - Target language code (2-letter ISO code, default: "fr")
     max_len (int) - Maximum length for translation output in tokens (default: 512)
+    batch_size (int) - Maximum number of texts per forward pass (default: TRANSLATION_BATCH_SIZE or 16)
+    num_beams (int) - Beam width for decoding, 1 for greedy (default: TRANSLATION_NUM_BEAMS or 1)
+    split_sentences (Union[bool, List[bool]]) - Whether to translate sentence by sentence, for all
+                                                texts or one flag per text (default: False)
 Return:
-    str - Translated text, cleaned and stripped of whitespace. Returns empty string if
-          input text is empty.
+    Union[str, List[str]] - Translated text, cleaned and stripped of whitespace, or a list of
+                            translations in input order if a list was passed. Empty inputs
+                            translate to empty strings.
 '''
-def translate(raw_text: str,
+def translate(raw_text: Union[str, List[str]],
               source_lang: str = "en",
               target_lang: str = "fr",
-              max_len: int = 512) -> str:
+              max_len: int = 512,
+              batch_size: int = BATCH_SIZE,
+              num_beams: int = NUM_BEAMS,
+              split_sentences: Union[bool, List[bool]] = False) -> Union[str, List[str]]:
+    # Normalize input to a batch
+    single = isinstance(raw_text, str)
+    texts = [raw_text] if single else list(raw_text)
+    split = [split_sentences] * len(texts) if isinstance(split_sentences, bool) else list(split_sentences)
+    trans_texts = [""] * len(texts)
+
     # Define Model to translate using
-    print("\t* Defining translation model.")
+    log("\t* Defining translation model.")
     model = f"Helsinki-NLP/opus-mt-{source_lang}-{target_lang}"
 
-    # Check text input
-    if not raw_text.strip():
-        print("\t* No text passed to translate.")
-        return ""
+    # Check text input, empty entries are passed through untranslated
+    todo = [i for i, text in enumerate(texts) if text and not text.isspace()]
+    if not todo:
+        log("\t* No text passed to translate.")
+        return trans_texts[0] if single else trans_texts
+
+    # Serve what we can from the on-disk cache. Keys describe the translator that actually runs,
+    # which is only loaded here if this configuration has never been seen
+    settings = translator_settings(source_lang, target_lang, model)
+    if settings is None:
+        settings = get_trans_pipe(source_lang, target_lang, model).settings
+    keys = {i: translation_cache.make_key(source_lang, target_lang, texts[i], split[i],
+                                          f"{settings}|beams={num_beams}")
+            for i in todo}
+    cached = translation_cache.get_many(list(set(keys.values())))
+    for i in todo:
+        if keys[i] in cached:
+            trans_texts[i] = cached[keys[i]]
+    todo = [i for i in todo if keys[i] not in cached]
+    if not todo:
+        log("\t* All text found in translation cache.")
+        return trans_texts[0] if single else trans_texts
 
     # Build translator
-    print("\t* Building translator.")
+    log("\t* Building translator.")
     translator = get_trans_pipe(source_lang, target_lang, model)
+    if translator.settings != settings:
+        # The recorded settings were out of date (e.g. the opus-mt model can be loaded now), so
+        # start over with keys for the translator that actually runs
+        return translate(raw_text if single else texts, source_lang, target_lang, max_len, batch_size,
+                         num_beams, split)
+
+    # Identical entries (e.g. a medium repeated across plaques) are only translated once
+    misses = {}
+    for i in todo:
+        misses.setdefault(keys[i], (texts[i], split[i]))
+
+    # Multi-sentence texts (descriptions) are split so each sentence is its own, shorter sequence
+    pieces = {key: SENTENCE_END_RE.split(text) if split_text else [text]
+              for key, (text, split_text) in misses.items()}
+    sentences = {sentence for parts in pieces.values() for sentence in parts[::2] if sentence}
+    # Sorted by length so each forward pass pads its texts to a similar length
+    batch = sorted(sentences, key=len)
+    batch_size = min(batch_size, len(batch))
 
     # Translate text
     # For NLLB models, you must specify forced_bos_token_id for target language
-    if "nllb" in translator.model.config._name_or_path:
-        # NLLB uses special tokens like 'eng_Latn', 'fra_Latn'
-        # Map simple codes to NLLB format (very partial mapping - extend as needed)
-        lang_map = {
-            "en": "eng_Latn", "fr": "fra_Latn", "de": "deu_Latn",
-            "es": "spa_Latn", "it": "ita_Latn", "zh": "zho_Hans"
-            # Add more as your project needs
-        }
-        tgt_lang_token = lang_map.get(target_lang, f"{target_lang}_Latn")
+    if is_nllb(translator):
+        # NLLB uses special tokens like 'eng_Latn', 'fra_Latn' (see NLLB_LANG_CODES)
+        bos_id = _nllb_bos_ids.get(target_lang)
+        if bos_id is None:
+            bos_id = _nllb_bos_ids[target_lang] = translator.tokenizer.convert_tokens_to_ids(f"{target_lang}_Latn")
         result = translator(
-            raw_text, 
+            batch, 
             max_length=max_len, 
-            forced_bos_token_id=translator.tokenizer.lang_code_to_id(tgt_lang_token)
+            batch_size=batch_size,
+            num_beams=num_beams,
+            forced_bos_token_id=bos_id
         )
     else:
-        print("\t* Translating text.")
-        result = translator(raw_text, max_len)
+        log("\t* Translating %d text(s) in batches of %d.", len(batch), batch_size)
+        result = translator(batch, max_length=max_len, batch_size=batch_size, num_beams=num_beams)
 
     # Clean output
-    print("\t* Cleaning translated ouput.")
-    trans_text: str = result[0]["translation_text"].strip()
+    log("\t* Cleaning translated ouput.")
+    translated = {sentence: item["translation_text"].strip() for sentence, item in zip(batch, result)}
+
+    # Reassemble the sentences with their original separators
+    fresh = {}
+    for key, parts in pieces.items():
+        parts[::2] = [translated[sentence] if sentence else sentence for sentence in parts[::2]]
+        fresh[key] = "".join(parts).strip()
+    for i in todo:
+        trans_texts[i] = fresh[keys[i]]
+    translation_cache.put_many(fresh)
 
-    return trans_text
\ No newline at end of file
+    return trans_texts[0] if single else trans_texts
+
+'''
+warmup()
+Description:
+    Loads the translation model for a language pair and runs a tiny input through it, so the
+    first real request does not pay for model loading and first-call initialization. Bypasses
+    the translation cache on purpose.
+Args:
+    source_lang (str) - Source language code (2-letter ISO code, default: "en")
+    target_lang (str) - Target language code (2-letter ISO code, default: "fr")
+Return:
+    None
+'''
+def warmup(source_lang: str = "en", target_lang: str = "fr") -> None:
+    log("\t* Warming up translation model.")
+    model = f"Helsinki-NLP/opus-mt-{source_lang}-{target_lang}"
+    translator = get_trans_pipe(source_lang, target_lang, model)
+    if not is_nllb(translator):
+        translator(["Hello."], batch_size=1)
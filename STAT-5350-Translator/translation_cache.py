@@ -0,0 +1,191 @@
+'''
+translation_cache.py
+
+Description:
+    This file handles the persistent on-disk cache for translated text. Translations are stored
+    in a SQLite database keyed by source language, target language, the translation settings
+    (model, backend, device, precision, beam width), and a SHA-1 hash of the source text, so
+    repeated runs over the same plaques (or shared boilerplate such as credit lines and mediums)
+    skip the translation model entirely. Recently used entries are also kept in memory so
+    long-running processes (batch mode, the server) skip the database too.
+
+Author:
+    Magnus Miller
+
+Date Last Updated:
+    01/22/26
+'''
+
+# Importing Libraries
+import hashlib
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Bump when a code change alters translation output, so stale entries are not reused
+TRANSLATION_CACHE_VERSION = 2
+
+# Cache database location, created on first use
+CACHE_DIR = os.path.join(os.getcwd(), "Cache_Files")
+CACHE_PATH = os.path.join(CACHE_DIR, "translation_cache.db")
+
+# Single connection per process, shared across threads behind a lock
+_conn: Optional[sqlite3.Connection] = None
+_conn_lock = threading.Lock()
+
+# In-memory LRU tier in front of the database, guarded by _conn_lock
+MEMORY_SIZE = 4096
+_memory: "OrderedDict[str, str]" = OrderedDict()
+
+'''
+settings_hash()
+Description:
+    Hashes the translation settings together with TRANSLATION_CACHE_VERSION. Memoized, since
+    every key built in a translate() call uses the same settings.
+Args:
+    settings (str) - Description of the translation settings (see translation.translator_settings())
+Return:
+    str - First 8 hex digits of the SHA-1 hash
+'''
+@lru_cache(maxsize=64)
+def settings_hash(settings: str) -> str:
+    return hashlib.sha1(f"v{TRANSLATION_CACHE_VERSION}|{settings}".encode("utf-8")).hexdigest()[:8]
+
+'''
+make_key()
+Description:
+    Builds the cache key for a piece of text translated between two languages. Changing any
+    translation setting changes the key, and text translated sentence by sentence is cached
+    separately from the same text translated whole.
+Args:
+    source_lang (str) - Source language code (2-letter ISO code)
+    target_lang (str) - Target language code (2-letter ISO code)
+    text (str) - Source text to be translated
+    split_sentences (bool) - Whether the text is translated sentence by sentence (default: False)
+    settings (str) - Description of the translation settings (default: "")
+Return:
+    str - Cache key of the form "<source>:<target>:<settings hash>[:s]:<sha1 of text>"
+'''
+def make_key(source_lang: str, target_lang: str, text: str, split_sentences: bool = False,
+             settings: str = "") -> str:
+    prefix = f"{source_lang}:{target_lang}:{settings_hash(settings)}:" + ("s:" if split_sentences else "")
+    return prefix + hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+'''
+get_conn()
+Description:
+    Opens (once per process) and returns the connection to the cache database. Enables WAL
+    journaling so concurrent CLI invocations can read while another one writes.
+Args:
+    None
+Return:
+    sqlite3.Connection - Open connection to the translation cache database
+'''
+def get_conn() -> sqlite3.Connection:
+    global _conn
+
+    if _conn is None:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        _conn = sqlite3.connect(CACHE_PATH, check_same_thread=False)
+        _conn.execute("PRAGMA journal_mode=WAL")
+        _conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT)")
+        _conn.execute("CREATE TABLE IF NOT EXISTS resolved (config TEXT PRIMARY KEY, settings TEXT)")
+        _conn.commit()
+    return _conn
+
+'''
+_remember()
+Description:
+    Adds entries to the in-memory tier, evicting the least recently used ones past MEMORY_SIZE.
+    Caller must hold _conn_lock.
+Args:
+    items (Iterable[Tuple[str, str]]) - (key, translation) pairs
+Return:
+    None
+'''
+def _remember(items: Iterable[Tuple[str, str]]) -> None:
+    for key, value in items:
+        _memory[key] = value
+        _memory.move_to_end(key)
+    while len(_memory) > MEMORY_SIZE:
+        _memory.popitem(last=False)
+
+'''
+get_many()
+Description:
+    Looks up a batch of keys in the cache, checking memory before the database.
+Args:
+    keys (List[str]) - Cache keys built with make_key()
+Return:
+    Dict[str, str] - Mapping of key to cached translation for every key that was found
+'''
+def get_many(keys: List[str]) -> Dict[str, str]:
+    if not keys:
+        return {}
+
+    with _conn_lock:
+        found = {}
+        for key in keys:
+            if key in _memory:
+                _memory.move_to_end(key)
+                found[key] = _memory[key]
+        missing = [key for key in keys if key not in found]
+        if missing:
+            conn = get_conn()
+            placeholders = ",".join("?" * len(missing))
+            rows = conn.execute(f"SELECT key, value FROM cache WHERE key IN ({placeholders})", missing).fetchall()
+            found.update(rows)
+            _remember(rows)
+    return found
+
+'''
+put_many()
+Description:
+    Stores a batch of translations in the cache with a single commit.
+Args:
+    items (Dict[str, str]) - Mapping of cache key to translated text
+Return:
+    None
+'''
+def put_many(items: Dict[str, str]) -> None:
+    if not items:
+        return
+
+    with _conn_lock:
+        conn = get_conn()
+        conn.executemany("INSERT OR REPLACE INTO cache (key, value) VALUES (?, ?)", items.items())
+        conn.commit()
+        _remember(items.items())
+
+'''
+get_resolved()
+Description:
+    Looks up the translator settings recorded for a translator configuration.
+Args:
+    config (str) - Configuration description (see translation.translator_config())
+Return:
+    Optional[str] - Recorded translator settings, or None if none were recorded
+'''
+def get_resolved(config: str) -> Optional[str]:
+    with _conn_lock:
+        row = get_conn().execute("SELECT settings FROM resolved WHERE config = ?", (config,)).fetchone()
+    return row[0] if row else None
+
+'''
+put_resolved()
+Description:
+    Records the settings of the translator a configuration resolved to.
+Args:
+    config (str) - Configuration description (see translation.translator_config())
+    settings (str) - Settings of the loaded translator
+Return:
+    None
+'''
+def put_resolved(config: str, settings: str) -> None:
+    with _conn_lock:
+        conn = get_conn()
+        conn.execute("INSERT OR REPLACE INTO resolved (config, settings) VALUES (?, ?)", (config, settings))
+        conn.commit()